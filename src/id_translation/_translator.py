@@ -155,7 +155,7 @@ class Translator(Generic[NameType, SourceType, IdType], HasSources[SourceType]):
     ) -> None:
         self._transformers = {} if transformers is None else transformers
 
-        self._fmt = fmt if isinstance(fmt, Format) else Format(fmt)
+        self._fmt = Format.parse(fmt)
         self._default_fmt_placeholders: InheritedKeysDict[SourceType, str, Any] | None
         self._default_fmt_placeholders, self._default_fmt = _handle_default(default_fmt, default_fmt_placeholders)
         self._enable_uuid_heuristics = enable_uuid_heuristics
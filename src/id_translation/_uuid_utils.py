@@ -31,6 +31,8 @@ def try_cast_one(idx: Any) -> Any:
     """Try casting `idx` to a UUID, falling back to the original input."""
     if isinstance(idx, UUID):
         return idx
+    if isinstance(idx, int) or (isinstance(idx, str) and len(idx) < 32):  # noqa: PLR2004
+        return idx  # Cannot be cast; a UUID string has at least 32 hex digits. Avoids raising and catching.
 
     try:
         return UUID(idx)
@@ -102,7 +102,8 @@ def _translate_pandas_vector(
         if is_numeric_dtype(pvt):
             # We don't need to cast float to int here, since hash(1.0) == hash(1). The cast in extract() is required
             # because some database drivers may complain, especially if they receive floats (especially NaN).
-            mapping = {idx: magic_dict[idx] for idx in pvt.unique()}
+            unique = pvt.unique()
+            mapping = dict(zip(unique, magic_dict.translate_many(unique)))
             return pvt.map(mapping)
         else:
             mapping = {}
@@ -57,8 +57,7 @@ class SequenceIO(DataStructureIO[T, NameType, SourceType, IdType]):
 def translate_sequence(s: T, names: list[NameType], tmap: TranslationMap[NameType, SourceType, IdType]) -> list[str]:
     """Return a translated copy of the sequence `s`."""
     if len(names) == 1:
-        magic_dict = tmap[names[0]]
-        return [magic_dict[i] for i in s]
+        return tmap[names[0]].translate_many(s)
 
     return [  # TODO resolve_io med cache
         translate_sequence(element, [name], tmap)  # type: ignore
@@ -28,8 +28,7 @@ class SetIO(DataStructureIO[set[IdType], NameType, SourceType, IdType]):
         tmap: TranslationMap[NameType, SourceType, IdType],
         copy: bool,
     ) -> set[str] | None:
-        magic_dict = tmap[names[0]]
-        translated = {magic_dict[e] for e in translatable}
+        translated = set(tmap[names[0]].translate_many(translatable))
 
         if copy:
             return translated
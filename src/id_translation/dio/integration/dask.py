@@ -59,7 +59,8 @@ class DaskIO(_dio.DataStructureIO[DaskT, str, _tt.SourceType, _tt.IdType]):
 
 
 def _translate_series(series: dd.Series, magic_dict: _MagicDict[_tt.IdType]) -> dd.Series:
-    mapping = {idx: magic_dict[idx] for idx in series.unique().compute()}
+    unique = series.unique().compute()
+    mapping = dict(zip(unique, magic_dict.translate_many(unique)))
     return series.replace(mapping)  # type: ignore[no-any-return]
 
 
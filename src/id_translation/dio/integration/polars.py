@@ -67,7 +67,8 @@ class PolarsIO(_dio.DataStructureIO[PolarsT, str, _tt.SourceType, _tt.IdType]):
             # the base case this is fine, but things like Transformer.try_add_missing_key will break.
             magic_dict = tmap[name]
             series = cls._obj_to_str(series)
-            mapping = {idx: magic_dict[idx] for idx in series.unique()}
+            unique = series.unique()
+            mapping = dict(zip(unique, magic_dict.translate_many(unique)))
             return series.replace_strict(mapping, return_dtype=pl.String)
 
         if isinstance(translatable, pl.DataFrame):
@@ -1,4 +1,5 @@
 import logging
+import sys
 import warnings
 from abc import abstractmethod
 from collections.abc import Iterable, Sequence
@@ -114,7 +115,12 @@ class AbstractFetcher(Fetcher[SourceType, IdType]):
     @final
     def initialize_sources(self, task_id: int = -1, *, force: bool = False) -> None:
         if self._placeholders is None or force:
-            self._placeholders = self._initialize_sources(task_id)
+            placeholders = self._initialize_sources(task_id)
+            # Names are compared frequently during mapping. Interning lets set and dict lookups use identity checks.
+            self._placeholders = {
+                _intern(source): [_intern(p) for p in source_placeholders]
+                for source, source_placeholders in placeholders.items()
+            }
 
     @abstractmethod
     def _initialize_sources(self, task_id: int) -> dict[SourceType, list[str]]:
@@ -661,3 +667,7 @@ class _ExtrasAdder(logging.Filter):
         for name, value in self.extras.items():
             setattr(record, name, value)
         return True
+
+
+def _intern(name: Any) -> Any:
+    return sys.intern(name) if type(name) is str else name
@@ -234,6 +234,11 @@ class Mapper(Generic[ValueType, CandidateType, ContextType]):
 
         unmapped_values = self._handle_overrides(scores, context, override_function)
 
+        # Write to positions in a plain array; label-based assignment with DataFrame.loc is slow for single cells.
+        grid = scores.to_numpy(dtype=float, copy=True)
+        value_pos: dict[Any, int] = {value: i for i, value in enumerate(scores.index)}
+        candidate_pos: dict[Any, int] = {candidate: j for j, candidate in enumerate(scores.columns)}
+
         verbose_logger = self._get_verbose_logger()
         for value in unmapped_values:
             filtered_candidates = self._apply_filters(value, candidates, context, kwargs)
@@ -248,8 +253,11 @@ class Mapper(Generic[ValueType, CandidateType, ContextType]):
                     verbose_logger.debug(f"Compute match scores for {value=}.")
                 scores_for_value = self._score(value, filtered_candidates, context, **self._score_kwargs, **kwargs)
 
+            row = grid[value_pos[value]]
             for score, candidate in zip(scores_for_value, filtered_candidates):
-                scores.loc[value, candidate] = score
+                row[candidate_pos[candidate]] = score
+
+        scores = pd.DataFrame(grid, index=scores.index, columns=scores.columns)
 
         if verbose_logger.isEnabledFor(logging.DEBUG):
             verbose_logger.debug(
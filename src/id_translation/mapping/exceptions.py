@@ -7,10 +7,21 @@ class MappingError(Exception):
     """Base exception class for all mapping-related issues."""
 
     def __init__(self, msg: str, ref: str = "") -> None:
+        if ref:
+            super().__init__(msg, ref)  # Keep the ref in args, so that pickle and copy of MappingError preserve it.
+        else:
+            super().__init__(msg)
+
+    def __str__(self) -> str:
+        # Formatted on demand; errors are often caught and discarded without ever being printed.
         link = "https://id-translation.readthedocs.io/en/stable/documentation/mapping-primer.html"
+        ref = self.args[1] if len(self.args) > 1 else ""
         if ref:
             link += f"#{ref}"
-        super().__init__(f"{msg}\n\nFor help, please refer to the {link} page.")
+        return f"{self._format_message()}\n\nFor help, please refer to the {link} page."
+
+    def _format_message(self) -> str:
+        return str(self.args[0]) if self.args else ""
 
 
 class UnmappedValuesError(MappingError):
@@ -21,18 +32,21 @@ class ScoringDisabledError(MappingError):
     """Indicates that the scoring logic has been disabled. Raised by :func:`.score_functions.disabled`."""
 
     def __init__(self, value: _Any, candidates: _Any, context: _Any) -> None:
-        super().__init__(
+        super().__init__("Scoring disabled.", ref="override-only-mapping")
+        self.value = value
+        self.candidates = candidates
+        self.context = context
+
+    def _format_message(self) -> str:
+        value, candidates, context = self.value, self.candidates, self.context
+        return (
             "Scoring disabled.\n"
             f"The Mapper is working in strict override-only mode, so the {value=} in {context=} "
             f"cannot be mapped to any of the {candidates=}. Possible solutions:\n"
             "    * Add an override or filter for this value, or\n"
             "    * Set strict=False (silently refuse to map instead of raising), or\n"
-            "    * Choose an appropriate score function to use.",
-            ref="override-only-mapping",
+            "    * Choose an appropriate score function to use."
         )
-        self.value = value
-        self.candidates = candidates
-        self.context = context
 
 
 class AmbiguousScoreError(MappingError):
@@ -4,12 +4,15 @@ import logging
 import re
 from collections.abc import Iterable as _Iterable
 from typing import Any as _Any
+from typing import NoReturn as _NoReturn
 
 from ..types import ID
 from . import exceptions
+from .types import FilterFunction
 
 VERBOSE: bool = False
 LOGGER = logging.getLogger(__package__).getChild("verbose").getChild("filter_functions")
+_LOGGERS = {name: LOGGER.getChild(name) for name in ("filter_names", "filter_sources", "filter_placeholders")}
 
 
 def filter_names(
@@ -52,7 +55,8 @@ def filter_names(
         The expression used selects names that end with `'_id'`.
     """
     function_name = filter_names.__name__
-    _check_context(function_name, context=context, want_none=True)
+    if context is not None:
+        _raise_bad_context(function_name, want_none=True)
     keep = _filter_single(
         value,
         regex=regex,
@@ -104,7 +108,8 @@ def filter_sources(
         return set(candidates)
 
     function_name = filter_names.__name__
-    _check_context(function_name, context=context, want_none=False)
+    if context is None:
+        _raise_bad_context(function_name, want_none=False)
     keep = _filter_single(
         context,
         regex=regex,
@@ -149,25 +154,60 @@ def filter_placeholders(
         >>> sorted(allowed)
         ['id', 'name']
     """
-    _check_context(filter_placeholders.__name__, context=context, want_none=False)
+    if context is None:
+        _raise_bad_context(filter_placeholders.__name__, want_none=False)
 
-    pattern = re.compile(regex, flags=re.IGNORECASE)
     candidates = set(candidates)
-    ans = {c for c in candidates if (pattern.match(c) is None) is remove}
+    if not candidates:
+        return candidates
+
+    return _filter_placeholders(candidates, context, re.compile(regex, flags=re.IGNORECASE), remove)
+
+
+def make_filter_placeholders(regex: str, remove: bool = False) -> FilterFunction[str, str, _Any]:
+    """Create a :func:`filter_placeholders` function with a fixed `regex`.
 
-    if VERBOSE:
-        logger = LOGGER.getChild(filter_placeholders.__name__)
-        if logger.isEnabledFor(logging.DEBUG) and len(ans) < len(candidates):
-            removed = candidates.difference(ans)
+    The `regex` is compiled once, when the function is created. Prefer this over binding arguments to
+    :func:`filter_placeholders` when the same filter is applied many times.
+
+    Args:
+        regex: A regex pattern. Will be matched against elements of the `candidates`.
+        remove: If ``True``, remove matching values.
+
+    Returns:
+        A filter function with signature ``(value, candidates, context)``.
+
+    Examples:
+        Removing irrelevant but possibly confusing columns.
+
+        >>> candidates = {"id", "name", "old_id", "previous_id"}
+        >>> filter_function = make_filter_placeholders("^(old|previous).*", remove=True)
+        >>> sorted(filter_function("ignored", candidates, "ignored"))
+        ['id', 'name']
+    """
+    pattern = re.compile(regex, flags=re.IGNORECASE)
+
+    def filter_function(value: str, candidates: _Iterable[str], context: _Any) -> set[str]:  # noqa: ARG001
+        if context is None:
+            _raise_bad_context(filter_placeholders.__name__, want_none=False)
+        return _filter_placeholders(set(candidates), context, pattern, remove)
+
+    return filter_function
+
+
+def _filter_placeholders(candidates: set[str], context: _Any, pattern: re.Pattern[str], remove: bool) -> set[str]:
+    ans = {c for c in candidates if (pattern.match(c) is not None) ^ remove}
+
+    if VERBOSE and len(ans) < len(candidates):
+        logger = _LOGGERS[filter_placeholders.__name__]
+        if logger.isEnabledFor(logging.DEBUG):
+            removed = candidates - ans
             logger.debug(f"Discard placeholders={removed!r} in source={context!r}; matches {pattern=}.")
 
     return ans
 
 
-def _check_context(name: str, context: _Any, want_none: bool) -> None:
-    if (context is None) is want_none:
-        return
-
+def _raise_bad_context(name: str, want_none: bool) -> _NoReturn:
     purpose = "name-to-source" if want_none else "placeholder"
     raise exceptions.BadFilterError(f"Function '{__name__}.{name}' should only be used for {purpose} mapping.")
 
@@ -180,10 +220,10 @@ def _filter_single(
     function_name: str,
     action: str = "Discard",
 ) -> bool:
-    keep = (re.match(regex, string, re.IGNORECASE) is None) is remove
+    keep = (re.match(regex, string, re.IGNORECASE) is not None) ^ remove
 
     if not keep and VERBOSE:
-        logger = LOGGER.getChild(function_name)
+        logger = _LOGGERS[function_name]
         if logger.isEnabledFor(logging.DEBUG):
             pattern = re.compile(regex, re.IGNORECASE)
             logger.debug(f"%s %s={string!r}; %s {pattern=}.", action, label, "matches" if remove else "does not match")
@@ -7,15 +7,19 @@ See Also:
 from __future__ import annotations
 
 import collections.abc as _abc
+import functools as _functools
 import logging as _logging
 import re as _re
+import sys as _sys
 import typing as _t
 
 VERBOSE: bool = False
 LOGGER = _logging.getLogger(__package__).getChild("verbose").getChild("heuristic_functions")
+_SHORT_CIRCUIT_LOGGER = LOGGER.getChild("short_circuit")
 
 
 _NOUN_TRANSFORMER_CACHE: dict[str, _abc.Callable[[str], str]] = {}
+_ID_SUFFIXES = ("id", "ids", "bitmask", "_")
 PluralToSingularArg = bool | dict[str, str] | _abc.Callable[[str], str] | str
 
 
@@ -57,16 +61,10 @@ def like_database_table(
         Inputs are coerced to lower case.
     """
     to_singular = _get_noun_transformer(plural_to_singular)
-
-    def _normalize_noun(noun: str) -> str:
-        noun = noun.lower()
-        noun = _strip_id_suffix(noun)
-        noun = noun.replace("_", "")
-        noun = noun.replace(".", "")
-        noun = to_singular(noun)
-        return noun
-
-    return _normalize_noun(name), [_normalize_noun(t) for t in tables]
+    # The built-in transformers are pure, so results may be cached. Custom transformers are called every time.
+    builtin = to_singular is _DEFAULT_NOUN_TRANSFORMER or to_singular is _noop
+    normalize = _normalize_noun_cached if builtin else _normalize_noun
+    return normalize(name, to_singular), [normalize(t, to_singular) for t in tables]
 
 
 def smurf_columns(
@@ -146,17 +144,20 @@ def smurf_columns(
     table = to_singular(table.lower())
 
     placeholder = placeholder.lower()
-    columns = {c.lower() for c in columns}
-
-    if placeholder == "name" and table in columns:
-        return {table}
-
     smurf = f"{table}_{placeholder}"
+    match_table = placeholder == "name"
+
+    found_smurf = False
     for column in columns:
-        if smurf == column.lower():
-            return {smurf}
+        column = column.lower()  # noqa: PLW2901
+        if column == smurf:
+            if not match_table:
+                return {_sys.intern(smurf)}
+            found_smurf = True  # Keep looking; the table column takes precedence.
+        elif match_table and column == table:
+            return {_sys.intern(table)}
 
-    return set()
+    return {_sys.intern(smurf)} if found_smurf else set()
 
 
 def short_circuit(
@@ -196,18 +197,61 @@ def short_circuit(
         {'humans'}
 
         Short-circuiting will only trigger if the `value_regex` matches, and the `target_candidate` is present.
+
+    See Also:
+        * :func:`make_short_circuit`
+    """
+    pattern = _compile_ci(value_regex) if isinstance(value_regex, str) else value_regex
+    return _short_circuit(value, candidates, pattern, target_candidate)
+
+
+def make_short_circuit(
+    *,
+    value_regex: str | _re.Pattern[str],
+    target_candidate: str,
+) -> _abc.Callable[[str, _abc.Iterable[str], _t.Any], set[str]]:
+    """Create a :func:`short_circuit` function with a fixed `value_regex` and `target_candidate`.
+
+    The `value_regex` is compiled once, when the function is created. Prefer this over binding arguments to
+    :func:`short_circuit` when the same heuristic is applied many times.
+
+    Args:
+        value_regex: A pattern match against `value`. Case-insensitive by default.
+        target_candidate: The candidate to short-circuit to.
+
+    Returns:
+        A short-circuiting function with signature ``(value, candidates, context)``.
+
+    Examples:
+        Always match any bite victim-columns to the `humans` table (see the :ref:`translation-primer` page).
+
+        >>> bite_victims = make_short_circuit(
+        ...     value_regex=".*_bite_victim$", target_candidate="humans"
+        ... )
+        >>> bite_victims("first_bite_victim", {"humans", "animals"}, None)
+        {'humans'}
     """
-    candidates = set(candidates)
     pattern = _re.compile(value_regex, flags=_re.IGNORECASE) if isinstance(value_regex, str) else value_regex
 
+    def short_circuit_function(value: str, candidates: _abc.Iterable[str], context: _t.Any) -> set[str]:  # noqa: ARG001
+        return _short_circuit(value, candidates, pattern, target_candidate)
+
+    return short_circuit_function
+
+
+def _short_circuit(
+    value: str, candidates: _abc.Iterable[str], pattern: _re.Pattern[str], target_candidate: str
+) -> set[str]:
     if target_candidate not in candidates:
-        LOGGER.getChild("short_circuit").debug(
-            f"Short-circuiting failed for {value=}: The {target_candidate=} is an input candidate."
-        )
+        if _SHORT_CIRCUIT_LOGGER.isEnabledFor(_logging.DEBUG):
+            _SHORT_CIRCUIT_LOGGER.debug(
+                f"Short-circuiting failed for {value=}: The {target_candidate=} is an input candidate."
+            )
         return set()
 
     if not pattern.match(value):
-        LOGGER.getChild("short_circuit").debug(f"Short-circuiting failed for {value=}: Does not match {pattern=}.")
+        if _SHORT_CIRCUIT_LOGGER.isEnabledFor(_logging.DEBUG):
+            _SHORT_CIRCUIT_LOGGER.debug(f"Short-circuiting failed for {value=}: Does not match {pattern=}.")
         return set()
 
     return {target_candidate}
@@ -219,7 +263,8 @@ def force_lower_case(
     context: _t.Any,  # noqa: ARG001
 ) -> tuple[str, list[str]]:
     """Force lower-case in `value` and `candidates`."""
-    return value.lower(), [c.lower() for c in candidates]
+    intern = _sys.intern
+    return intern(value.lower()), [intern(c.lower()) for c in candidates]
 
 
 def value_fstring_alias(
@@ -304,10 +349,36 @@ def candidate_fstring_alias(
     if "{candidate}" not in fstring:
         raise ValueError(f"Invalid {fstring=} passed to candidate_fstring_alias(); does not contain {{candidate}}.")
 
-    return value, [fstring.format(value=value, candidate=c, context=context, **kwargs) for c in candidates]
+    if "candidate" in kwargs:
+        raise TypeError("candidate_fstring_alias() got multiple values for argument 'candidate'")
+
+    # Reuse the same mapping for every candidate; format_map() does not copy it.
+    fields = {**kwargs, "value": value, "context": context}
+    formatted = []
+    for c in candidates:
+        fields["candidate"] = c
+        formatted.append(fstring.format_map(fields))
+    return value, formatted
+
+
+@_functools.lru_cache(maxsize=256)
+def _compile_ci(pattern: str) -> _re.Pattern[str]:
+    return _re.compile(pattern, flags=_re.IGNORECASE)
+
+
+def _normalize_noun(noun: str, to_singular: _abc.Callable[[str], str]) -> str:
+    # Chained replace() is faster than str.translate() with a deletion table, which takes a slow generic path.
+    noun = to_singular(_strip_id_suffix(noun.lower()).replace("_", "").replace(".", ""))
+    return _sys.intern(noun) if type(noun) is str else noun  # Custom transformers may return other types.
+
+
+_normalize_noun_cached = _functools.lru_cache(maxsize=4096)(_normalize_noun)
 
 
 def _strip_id_suffix(string: str) -> str:
+    if not string.endswith(_ID_SUFFIXES):
+        return string  # Typical for table names.
+
     for suffix in "id", "ids", "bitmask":
         sz = len(suffix)
         if len(string) > sz and string.endswith(suffix):
@@ -382,28 +453,53 @@ class NounTransformer:
     )
     """Plural-to-singular suffix mappings."""
 
+    _MAX_CACHE_SIZE: _t.ClassVar[int] = 1024
+    _SUFFIXES: _t.ClassVar[tuple[str, ...]] = tuple(suffix for suffix, _ in PLURAL_TO_SINGULAR_SUFFIXES)
+
+    def __init_subclass__(cls, **kwargs: _t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._SUFFIXES = tuple(suffix for suffix, _ in cls.PLURAL_TO_SINGULAR_SUFFIXES)
+
     def __init__(self, custom: dict[str, str] | None = None) -> None:
         if custom is None:
             custom = {}
         self._pre = {**self.IRREGULARS, **custom}
+        self._cache: dict[str, str] = {}
 
     def __call__(self, noun: str) -> str:
         """Convert to singular form."""
+        singular = self._cache.get(noun)
+        if singular is not None:
+            return singular
+
         singular = self._pre.get(noun)
-        return self._to_singular(noun) if singular is None else singular
+        if singular is None:
+            singular = self._to_singular(noun)
+
+        if len(self._cache) < self._MAX_CACHE_SIZE:
+            self._cache[noun] = singular
+        return singular
 
     @classmethod
     def _to_singular(cls, plural: str) -> str:
+        if not plural.endswith(cls._SUFFIXES):
+            return plural
+
         for suffix, replacement in cls.PLURAL_TO_SINGULAR_SUFFIXES:
             if plural.endswith(suffix):
                 return plural[: -len(suffix)] + replacement
         return plural
 
 
+_DEFAULT_NOUN_TRANSFORMER = NounTransformer()
+
+
 def _get_noun_transformer(plural_to_singular: PluralToSingularArg) -> _abc.Callable[[str], str]:
     """Returns a NOOP if `plural_to_singular` is ``False``."""
+    if plural_to_singular is True:
+        return _DEFAULT_NOUN_TRANSFORMER
     if plural_to_singular is False:
-        return lambda noun: noun
+        return _noop
 
     if isinstance(plural_to_singular, str):
         from rics.misc import get_by_full_name
@@ -418,6 +514,8 @@ def _get_noun_transformer(plural_to_singular: PluralToSingularArg) -> _abc.Calla
     if callable(plural_to_singular):
         return plural_to_singular
 
-    if plural_to_singular is True:
-        plural_to_singular = {}
     return NounTransformer(plural_to_singular)
+
+
+def _noop(noun: str) -> str:
+    return noun
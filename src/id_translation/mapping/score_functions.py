@@ -5,12 +5,18 @@ See Also:
 """
 
 from collections.abc import Iterable as _Iterable
+from operator import eq as _eq
+
+import numpy as _np
 
 from . import exceptions
 from .types import CandidateType, ContextType, ValueType
 
 VERBOSE: bool = False
 
+_VECTORIZE_MIN_CANDIDATES = 24
+"""Use :mod:`numpy` in :func:`modified_hamming` when there are at least this many candidates."""
+
 
 def modified_hamming(
     name: str,
@@ -19,6 +25,7 @@ def modified_hamming(
     *,
     add_length_ratio_term: bool = True,
     positional_penalty: float = 0.001,
+    min_score: float | None = None,
 ) -> _Iterable[float]:
     """Compute hamming distance modified by length ratio, from the back. Score range is ``[0, 1]``.
 
@@ -29,6 +36,8 @@ def modified_hamming(
         add_length_ratio_term: If ``True``, score is divided by ``abs(len(name) - len(candidate))``.
         positional_penalty: A penalty applied to prefer earlier `candidates`, according to the formulare
             ``penalty = index(candidate) * positional_penalty)``.
+        min_score: If given, scores below `min_score` are returned as ``-inf``. Candidates that cannot reach
+            `min_score` because of the length ratio term and positional penalty alone are not compared at all.
 
     Examples:
         >>> from id_translation.mapping.score_functions import modified_hamming
@@ -42,18 +51,69 @@ def modified_hamming(
         [1.0, 0.5, 0.5, 1.0]
         >>> list(modified_hamming("face", ["face", "FAce", "race", "place"], context=None))
         [1.0, 0.499, 0.748, 0.372]
+        >>> list(
+        ...     modified_hamming(
+        ...         "face", ["face", "FAce", "race", "place"], context=None, min_score=0.5
+        ...     )
+        ... )
+        [1.0, -inf, 0.748, -inf]
     """
+    candidates = list(candidates)
+    if len(candidates) >= _VECTORIZE_MIN_CANDIDATES and name and all(candidates):
+        yield from _modified_hamming_numpy(name, candidates, add_length_ratio_term, positional_penalty, min_score)
+        return
+
+    n = len(name)
 
     def _apply(candidate: str) -> float:
-        sz = min(len(candidate), len(name))
-        same = sum([name[i] == candidate[i] for i in range(-sz, 0)])
+        m = len(candidate)
+        sz = min(m, n)
+        same: int = sum(map(_eq, name[n - sz :], candidate[m - sz :]))
 
-        ratio = (1 / (1 + abs(len(candidate) - len(name)))) if add_length_ratio_term else 1
+        ratio = (1 / (1 + abs(m - n))) if add_length_ratio_term else 1
         normalized_hamming = same / sz
 
         return ratio * normalized_hamming
 
-    yield from (s - i * positional_penalty for i, s in enumerate(map(_apply, candidates)))
+    if min_score is None:
+        yield from (s - i * positional_penalty for i, s in enumerate(map(_apply, candidates)))
+        return
+
+    for i, candidate in enumerate(candidates):
+        penalty = i * positional_penalty
+        # The ratio term is an upper bound for the score; don't compare characters if min_score is out of reach.
+        upper_bound = (1 / (1 + abs(len(candidate) - n))) if add_length_ratio_term else 1
+        score = _apply(candidate) - penalty if upper_bound - penalty >= min_score else -_np.inf
+        yield score if score >= min_score else -_np.inf
+
+
+def _modified_hamming_numpy(
+    name: str,
+    candidates: list[str],
+    add_length_ratio_term: bool,
+    positional_penalty: float,
+    min_score: float | None,
+) -> list[float]:
+    # Strings are reversed so that comparing from the back becomes comparing from the front. The fixed-width dtype
+    # truncates candidates to len(name) code points, and the UTF-32 code units are compared directly. Operations are
+    # ordered as in the scalar version, so that the results are identical.
+    n, k = len(candidates), len(name)
+    dtype = f"<U{k}"
+
+    lengths = _np.fromiter(map(len, candidates), dtype=_np.int64, count=n)
+    sz = _np.minimum(lengths, k)
+
+    reversed_candidates = _np.array([c[::-1] for c in candidates], dtype=dtype).view(_np.uint32).reshape(n, k)
+    reversed_name = _np.array([name[::-1]], dtype=dtype).view(_np.uint32)
+    same = ((reversed_candidates == reversed_name) & (_np.arange(k) < sz[:, None])).sum(axis=1)
+
+    scores = same / sz
+    if add_length_ratio_term:
+        scores = (1 / (1 + _np.abs(lengths - k))) * scores
+    scores -= _np.arange(n) * positional_penalty
+    if min_score is not None:
+        scores[scores < min_score] = -_np.inf
+    return scores.tolist()  # type: ignore[no-any-return]
 
 
 def equality(
@@ -68,7 +128,7 @@ def equality(
         >>> list(equality("a", "aAb", context=None))
         [1.0, 0.0, 0.0]
     """
-    yield from map(float, (value == c for c in candidates))
+    yield from [1.0 if value == c else 0.0 for c in candidates]
 
 
 def disabled(
@@ -11,10 +11,11 @@ from collections import defaultdict as _defaultdict
 from collections.abc import Iterable as _Iterable
 from contextlib import contextmanager as _contextmanager
 from dataclasses import dataclass as _dataclass
+from typing import Any, Optional
 from typing import Generic as _Generic
-from typing import Optional
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from ._cardinality import Cardinality as _Cardinality
@@ -26,6 +27,8 @@ warnings.warn(
     "This module is considered an implementation detail, and may change without notice.", UserWarning, stacklevel=2
 )
 _MATCH_SCORES_LOGGER = logging.getLogger(__package__).getChild("MatchScores")
+_SortedScores = tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]]
+"""Value positions, candidate positions, and scores; sorted by descending score."""
 
 
 @_contextmanager
@@ -42,6 +45,10 @@ def enable_verbose_debug_messages():  # type: ignore  # noqa
 
     before = filter_functions.VERBOSE, heuristic_functions.VERBOSE, score_functions.VERBOSE, _VERBOSE_LOGGER.disabled
     enable = (True, True, True, False)
+    if before == enable and _mapper.FORCE_VERBOSE:
+        yield  # Already enabled, e.g. by an enclosing context. Leave restoring the old state to the owner.
+        return
+
     try:
         (
             filter_functions.VERBOSE,
@@ -73,7 +80,10 @@ class MatchScores:
     def __init__(self, scores: pd.DataFrame, min_score: float, logger: logging.Logger | None = None) -> None:
         self._min_score = min_score
         self._matrix = scores
+        self._values: list[Any] = scores.index.tolist()
+        self._candidates: list[Any] = scores.columns.tolist()
         self._logger = _MATCH_SCORES_LOGGER if logger is None else logger
+        self._sorted: dict[float | None, _SortedScores] = {}
 
     @property
     def logger(self) -> logging.Logger:
@@ -90,41 +100,58 @@ class MatchScores:
         Returns:
             A ``DirectionalMapping``.
         """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if not debug and self._has_unique_labels():
+            # Group candidates by value position; no Record instances are needed without DEBUG messages.
+            rows, columns, _ = self._match_positions(cardinality)
+            return _DirectionalMapping(
+                cardinality=cardinality,
+                left_to_right=self._group_by_value(rows, columns),
+                _verify=False,
+            )
+
         matches: list[MatchScores.Record[ValueType, CandidateType]]
         rejections: list[MatchScores.Reject[ValueType, CandidateType]]
         matches, rejections = self._match(cardinality)
 
+        superseded_by = _defaultdict(list)
+        if debug:
+            for rr in rejections:
+                if rr.superseding_value is not None:
+                    superseded_by[rr.superseding_value].append(rr)
+                if rr.superseding_candidate is not None and rr.superseding_candidate != rr.superseding_value:
+                    superseded_by[rr.superseding_candidate].append(rr)
+
         left_to_right = _defaultdict(list)
-        for record in list(matches):
-            supersedes: list[MatchScores.Reject[ValueType, CandidateType]] = []
-            if self.logger.isEnabledFor(logging.DEBUG) and rejections:
-                for rr in rejections:
-                    if record in (rr.superseding_value, rr.superseding_candidate):
-                        supersedes.append(rr)  # noqa: PERF401
-
-            if self.logger.isEnabledFor(logging.DEBUG):
+        for record in matches:
+            if debug:
                 reason = "(short-circuit or override)" if record.score == np.inf else f">= {self._min_score}"
                 self.logger.debug(f"Accepted: {record} {reason}.")
 
-            if supersedes:
-                s = "\n".join("    " + rr.explain(self._min_score) for rr in supersedes)
-                self.logger.debug(f"This match supersedes {len(supersedes)} other matches:\n{s}")
+                if supersedes := superseded_by.get(record):
+                    s = "\n".join("    " + rr.explain(self._min_score) for rr in supersedes)
+                    self.logger.debug(f"This match supersedes {len(supersedes)} other matches:\n{s}")
 
             left_to_right[record.value].append(record.candidate)
 
-        if rejections and self.logger.isEnabledFor(logging.DEBUG):
-            unmapped_values = set(self._matrix.index.difference(left_to_right))
+        if rejections and debug:
+            rejections_by_value = _defaultdict(list)
+            for rr in rejections:
+                rejections_by_value[rr.record.value].append(rr)
+
+            unmapped_values = set(self._values).difference(left_to_right)
             for value in unmapped_values:
-                lst = []
-                for rr in filter(lambda r: r.record.value == value, rejections):
-                    lst.append(f"    {rr.explain(self._min_score, full=True)}")  # noqa: PERF401
-                value_reasons = "\n".join(lst)
+                value_reasons = "\n".join(
+                    f"    {rr.explain(self._min_score, full=True)}" for rr in rejections_by_value.get(value, ())
+                )
                 self.logger.debug(f"Could not map {value=}:\n{value_reasons}")
 
         return _DirectionalMapping(
             cardinality=cardinality,
             left_to_right={
-                value: tuple(left_to_right[value]) for value in self._matrix.index if value in left_to_right
+                value: tuple(candidates)
+                for value in self._values
+                if (candidates := left_to_right.get(value)) is not None
             },
             _verify=False,
         )
@@ -132,12 +159,8 @@ class MatchScores:
     def _match(
         self, cardinality: _Cardinality = None
     ) -> tuple[list["MatchScores.Record[ValueType, CandidateType]"], list["Reject[ValueType, CandidateType]"]]:
-        rejections: list[MatchScores.Reject[ValueType, CandidateType]] | None = None
-        records: list[MatchScores.Record[ValueType, CandidateType]] = self.get_above()
-
-        if self.logger.isEnabledFor(logging.DEBUG):
-            rejections = []
-            records.extend(self.get_below())
+        rejections: list[MatchScores.Reject[ValueType, CandidateType]] = []
+        records: list[MatchScores.Record[ValueType, CandidateType]] = self._from_arrays(*self._get_sorted())
 
         if cardinality is _Cardinality.OneToOne:
             matches = self._select_one_to_one(records, rejections)
@@ -148,24 +171,76 @@ class MatchScores:
         else:
             matches = self._select_many_to_many(records, rejections)
 
-        return list(matches), rejections or []
+        return list(matches), rejections
+
+    def _has_unique_labels(self) -> bool:
+        # Selection by position treats duplicate labels as different values or candidates.
+        return self._matrix.index.is_unique and self._matrix.columns.is_unique
+
+    def _match_positions(self, cardinality: _Cardinality = None) -> _SortedScores:
+        # Same as _match(), but without rejections. Records below the threshold are discarded before sorting.
+        rows, columns, scores = self._get_sorted(self._min_score)
+
+        if cardinality is None or cardinality is _Cardinality.ManyToMany:
+            return rows, columns, scores  # Every record is a match.
+
+        if cardinality is _Cardinality.OneToOne:
+            keep = self._select_one_to_one_positions(rows, columns, scores)
+        elif cardinality is _Cardinality.OneToMany:
+            keep = self._select_first_positions(columns, rows, columns, scores, "candidate", cardinality)
+        else:
+            keep = self._select_first_positions(rows, rows, columns, scores, "value", cardinality)
+        return rows[keep], columns[keep], scores[keep]
+
+    def _group_by_value(
+        self,
+        rows: npt.NDArray[np.intp],
+        columns: npt.NDArray[np.intp],
+    ) -> dict[ValueType, tuple[CandidateType, ...]]:
+        # Matches are grouped in buckets indexed by value position, which also keeps the values in index order.
+        buckets: list[list[int]] = [[] for _ in range(len(self._values))]
+        for i, j in zip(rows.tolist(), columns.tolist()):
+            buckets[i].append(j)
+
+        values, candidates = self._values, self._candidates
+        return {values[i]: tuple([candidates[j] for j in bucket]) for i, bucket in enumerate(buckets) if bucket}
+
+    def _get_sorted(self, min_score: float | None = None) -> _SortedScores:
+        if (cached := self._sorted.get(min_score)) is not None:
+            return cached
+
+        # Sort the flat score grid directly; stacking creates a MultiIndex just to throw it away. Order is the same as
+        # stack() + stable sort_values(ascending=False): row-major within equal scores, with NaN cells dropped.
+        grid = self._matrix.to_numpy(dtype=np.float64)
+        flat = grid.ravel()
+        if min_score is None:
+            order = np.argsort(-flat, kind="stable")
+            order = order[~np.isnan(flat[order])]
+        else:
+            keep = np.flatnonzero(flat >= min_score)  # Ascending, so ties stay in row-major order.
+            order = keep[np.argsort(-flat[keep], kind="stable")]
+        rows, columns = np.divmod(order, grid.shape[1])
+        self._sorted[min_score] = rows, columns, flat[order]
+        return self._sorted[min_score]
 
-    def _get_sorted(self) -> pd.Series:
-        sorted_scores: pd.Series = self._matrix.stack()  # noqa: PD013
-        sorted_scores = sorted_scores.sort_values(ascending=False, kind="stable")
-        return sorted_scores
+    def _count_above(self, scores: npt.NDArray[np.float64]) -> int:
+        # Scores are sorted in descending order, so records above the threshold are a prefix and the rest a suffix.
+        # Binary search on the reversed (ascending) view to find the split point.
+        return len(scores) - int(np.searchsorted(scores[::-1], self._min_score, side="left"))
 
     def get_above(self) -> list["MatchScores.Record[ValueType, CandidateType]"]:
         """Get all records with scores `above` the threshold."""
-        s = self._get_sorted()
-        return self._from_series(s[s >= self._min_score])
+        rows, columns, scores = self._get_sorted()
+        n_above = self._count_above(scores)
+        return self._from_arrays(rows[:n_above], columns[:n_above], scores[:n_above])
 
     def get_below(self) -> list["MatchScores.Record[ValueType, CandidateType]"]:
         """Get all records with scores `below` the threshold."""
-        s = self._get_sorted()
-        return self._from_series(s[s < self._min_score])
+        rows, columns, scores = self._get_sorted()
+        n_above = self._count_above(scores)
+        return self._from_arrays(rows[n_above:], columns[n_above:], scores[n_above:])
 
-    @_dataclass(frozen=True)
+    @_dataclass(frozen=True, slots=True)
     class Record(_Generic[ValueType, CandidateType]):
         """Data concerning a match."""
 
@@ -179,11 +254,19 @@ class MatchScores:
         def __str__(self) -> str:
             return f"{self.value!r} -> '{self.candidate}'; score={self.score:.3f}"
 
-    @classmethod
-    def _from_series(cls, s: pd.Series) -> list[Record[ValueType, CandidateType]]:
-        return [MatchScores.Record(value, candidate, score) for (value, candidate), score in s.items()]
-
-    @_dataclass(frozen=True)
+    def _from_arrays(
+        self,
+        rows: npt.NDArray[np.intp],
+        columns: npt.NDArray[np.intp],
+        scores: npt.NDArray[np.float64],
+    ) -> list[Record[ValueType, CandidateType]]:
+        values, candidates = self._values, self._candidates
+        return [
+            MatchScores.Record(values[i], candidates[j], score)
+            for i, j, score in zip(rows.tolist(), columns.tolist(), scores.tolist())
+        ]
+
+    @_dataclass(frozen=True, slots=True)
     class Reject(_Generic[ValueType, CandidateType]):
         """Data concerning the rejection of a match."""
 
@@ -227,23 +310,15 @@ class MatchScores:
     def _raise_if_ambiguous(
         self,
         record: Record,  # type: ignore[type-arg]
-        matches: dict,  # type: ignore[type-arg]
+        old_match: Record | None,  # type: ignore[type-arg]
         kind: str,
         cardinality: _Cardinality,
     ) -> None:
-        if record.score == np.inf:
-            # Overrides are allowed to be infinite; the first one will be chosen. It's up to the user to manage them.
-            return
-
-        key = record.value if kind == "value" else record.candidate
-        if key not in matches:
-            return
-
-        old_match = matches[key]
-        if record.score == old_match.score:
+        # Overrides are allowed to be infinite; the first one will be chosen. It's up to the user to manage them.
+        if old_match is not None and record.score == old_match.score and record.score != np.inf:
             raise _AmbiguousScoreError(
                 kind=kind,
-                key=key,
+                key=record.value if kind == "value" else record.candidate,
                 match0=record,
                 match1=old_match,
                 cardinality=cardinality.name,
@@ -253,42 +328,121 @@ class MatchScores:
     def _select_one_to_one(
         self,
         records: _Iterable[Record[ValueType, CandidateType]],
-        rejections: list[Reject[ValueType, CandidateType]] | None = None,
+        rejections: list[Reject[ValueType, CandidateType]],
     ) -> _Iterable[Record[ValueType, CandidateType]]:
         mvs: dict[ValueType, MatchScores.Record[ValueType, CandidateType]] = {}
         mcs: dict[CandidateType, MatchScores.Record[ValueType, CandidateType]] = {}
 
         for record in records:
-            self._raise_if_ambiguous(record, mcs, "candidate", _Cardinality.OneToOne)
-            self._raise_if_ambiguous(record, mvs, "value", _Cardinality.OneToOne)
-
-            if record.score < self._min_score or record.value in mvs or record.candidate in mcs:
-                if rejections is not None:
-                    rejections.append(
-                        MatchScores.Reject(
-                            record,
-                            superseding_value=mvs.get(record.value),
-                            superseding_candidate=mcs.get(record.candidate),
-                        )
+            old_value_match = mvs.get(record.value)
+            old_candidate_match = mcs.get(record.candidate)
+            self._raise_if_ambiguous(record, old_candidate_match, "candidate", _Cardinality.OneToOne)
+            self._raise_if_ambiguous(record, old_value_match, "value", _Cardinality.OneToOne)
+
+            if record.score < self._min_score or old_value_match is not None or old_candidate_match is not None:
+                rejections.append(
+                    MatchScores.Reject(
+                        record,
+                        superseding_value=old_value_match,
+                        superseding_candidate=old_candidate_match,
                     )
+                )
                 continue
             mvs[record.value] = record
             mcs[record.candidate] = record
             yield record
 
+    def _select_one_to_one_positions(
+        self,
+        rows: npt.NDArray[np.intp],
+        columns: npt.NDArray[np.intp],
+        scores: npt.NDArray[np.float64],
+    ) -> list[int]:
+        # Same as _select_one_to_one(), but without rejections. Works on positions, so that Record instances are only
+        # created for accepted matches. Returns positions in the sorted arrays.
+        n_values, n_candidates = len(self._values), len(self._candidates)
+        value_match: list[int | None] = [None] * n_values
+        candidate_match: list[int | None] = [None] * n_candidates
+        score_list = scores.tolist()
+        n_inf = self._count_infinite(scores)
+
+        keep = []
+        for pos, (i, j, score) in enumerate(zip(rows.tolist(), columns.tolist(), score_list)):
+            old_value_match = value_match[i]
+            old_candidate_match = candidate_match[j]
+
+            if old_value_match is None and old_candidate_match is None:
+                value_match[i] = candidate_match[j] = pos
+                keep.append(pos)
+            elif pos >= n_inf:
+                if old_candidate_match is not None and score_list[old_candidate_match] == score:
+                    self._raise_for_positions(pos, old_candidate_match, rows, columns, scores, "candidate")
+                if old_value_match is not None and score_list[old_value_match] == score:
+                    self._raise_for_positions(pos, old_value_match, rows, columns, scores, "value")
+
+        return keep
+
+    def _select_first_positions(
+        self,
+        keys: npt.NDArray[np.intp],
+        rows: npt.NDArray[np.intp],
+        columns: npt.NDArray[np.intp],
+        scores: npt.NDArray[np.float64],
+        kind: str,
+        cardinality: _Cardinality,
+    ) -> list[int]:
+        # Same as _select_one_to_many() or _select_many_to_one(), but without rejections. Records are sorted by score,
+        # so the match for each key (value or candidate position) is its first record. Returns positions in the sorted
+        # arrays.
+        match: dict[int, int] = {}
+        score_list = scores.tolist()
+        n_inf = self._count_infinite(scores)
+
+        keep = []
+        for pos, (key, score) in enumerate(zip(keys.tolist(), score_list)):
+            old = match.get(key)
+            if old is None:
+                match[key] = pos
+                keep.append(pos)
+            elif pos >= n_inf and score_list[old] == score:
+                self._raise_for_positions(pos, old, rows, columns, scores, kind, cardinality)
+
+        return keep
+
+    @staticmethod
+    def _count_infinite(scores: npt.NDArray[np.float64]) -> int:
+        # Scores are sorted in descending order, so infinite scores (overrides and short-circuits) are a prefix. These
+        # are never ambiguous; see _raise_if_ambiguous().
+        return len(scores) - int(np.searchsorted(scores[::-1], np.inf, side="left"))
+
+    def _raise_for_positions(
+        self,
+        pos: int,
+        old_pos: int,
+        rows: npt.NDArray[np.intp],
+        columns: npt.NDArray[np.intp],
+        scores: npt.NDArray[np.float64],
+        kind: str,
+        cardinality: _Cardinality = _Cardinality.OneToOne,
+    ) -> None:
+        pair = [pos, old_pos]
+        records: list[MatchScores.Record] = self._from_arrays(rows[pair], columns[pair], scores[pair])  # type: ignore[type-arg]
+        record, old_record = records
+        self._raise_if_ambiguous(record, old_record, kind, cardinality)
+
     def _select_one_to_many(
         self,
         records: _Iterable[Record[ValueType, CandidateType]],
-        rejections: list[Reject[ValueType, CandidateType]] | None = None,
+        rejections: list[Reject[ValueType, CandidateType]],
     ) -> _Iterable[Record[ValueType, CandidateType]]:
         mcs: dict[CandidateType, MatchScores.Record[ValueType, CandidateType]] = {}
 
         for record in records:
-            self._raise_if_ambiguous(record, mcs, "candidate", _Cardinality.OneToMany)
+            old_match = mcs.get(record.candidate)
+            self._raise_if_ambiguous(record, old_match, "candidate", _Cardinality.OneToMany)
 
-            if record.score < self._min_score or record.candidate in mcs:
-                if rejections is not None:
-                    rejections.append(MatchScores.Reject(record, superseding_candidate=mcs.get(record.candidate)))
+            if record.score < self._min_score or old_match is not None:
+                rejections.append(MatchScores.Reject(record, superseding_candidate=old_match))
                 continue
             mcs[record.candidate] = record
             yield record
@@ -296,16 +450,16 @@ class MatchScores:
     def _select_many_to_one(
         self,
         records: _Iterable[Record[ValueType, CandidateType]],
-        rejections: list[Reject[ValueType, CandidateType]] | None = None,
+        rejections: list[Reject[ValueType, CandidateType]],
     ) -> _Iterable[Record[ValueType, CandidateType]]:
         mvs: dict[ValueType, MatchScores.Record[ValueType, CandidateType]] = {}
 
         for record in records:
-            self._raise_if_ambiguous(record, mvs, "value", cardinality=_Cardinality.ManyToOne)
+            old_match = mvs.get(record.value)
+            self._raise_if_ambiguous(record, old_match, "value", cardinality=_Cardinality.ManyToOne)
 
-            if record.score < self._min_score or record.value in mvs:
-                if rejections is not None:
-                    rejections.append(MatchScores.Reject(record, superseding_value=mvs.get(record.value)))
+            if record.score < self._min_score or old_match is not None:
+                rejections.append(MatchScores.Reject(record, superseding_value=old_match))
                 continue
             mvs[record.value] = record
             yield record
@@ -313,11 +467,10 @@ class MatchScores:
     def _select_many_to_many(
         self,
         records: _Iterable[Record[ValueType, CandidateType]],
-        rejections: list[Reject[ValueType, CandidateType]] | None = None,
+        rejections: list[Reject[ValueType, CandidateType]],
     ) -> _Iterable[Record[ValueType, CandidateType]]:
         for record in records:
             if record.score < self._min_score:
-                if rejections is not None:
-                    rejections.append(MatchScores.Reject(record))
+                rejections.append(MatchScores.Reject(record))
                 continue
             yield record
@@ -1,4 +1,6 @@
 from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from string import Formatter
 from typing import Any
 
 from rics.misc import tname
@@ -6,6 +8,10 @@ from rics.misc import tname
 from . import parse_format_string
 from .types import FormatType, PlaceholdersTuple
 
+_MAX_CACHED_FSTRINGS = 64
+"""Maximum number of :meth:`Format.fstring` results to keep per ``Format`` instance."""
+_FORMATTER = Formatter()
+
 
 class Format:
     """Format specification for translations strings.
@@ -108,6 +114,10 @@ class Format:
     def __init__(self, fmt: str) -> None:
         self._fmt = fmt
         self._elements: list[parse_format_string.Element] = parse_format_string.get_elements(fmt)
+        self._placeholders = self._extract_placeholders(self._elements)
+        self._required_placeholders = self._extract_placeholders(e for e in self._elements if e.required)
+        self._required_placeholders_set = frozenset(self._required_placeholders)
+        self._fstrings: dict[tuple[PlaceholdersTuple, bool], str] = {}
 
     def format(self, **placeholders: Any) -> str:
         """Apply the format.
@@ -127,7 +137,8 @@ class Format:
 
         Args:
             placeholders: Keys to keep. Passing ``None`` is equivalent to passing :attr:`required_placeholders`.
-            positional: If ``True``, remove names to return a positional fstring.
+            positional: If ``True``, remove names to return a positional fstring. Repeated placeholders are
+                numbered instead, e.g. ``'{id} ({id})'`` becomes ``'{0} ({0})'``.
 
         Returns:
             An fstring with optional elements removed unless included in `placeholders`.
@@ -135,18 +146,32 @@ class Format:
         Raises:
             KeyError: If required placeholders are missing.
         """
-        placeholders = placeholders or self.required_placeholders
-        missing_required_placeholders = set(self.required_placeholders).difference(placeholders)
+        placeholders = placeholders or self._required_placeholders
+        key = tuple(placeholders), positional
+        if (fstring := self._fstrings.get(key)) is not None:
+            return fstring
+
+        missing_required_placeholders = set(self._required_placeholders_set.difference(key[0]))
         if missing_required_placeholders:
             raise KeyError(f"Required key(s) {missing_required_placeholders} missing from {placeholders=}.")
 
-        return self._make_fstring(placeholders, positional=positional)
+        fstring = self._make_fstring(key[0], positional=positional)
+        if len(self._fstrings) < _MAX_CACHED_FSTRINGS:
+            self._fstrings[key] = fstring
+        return fstring
 
     def _make_fstring(self, placeholders: Iterable[str], positional: bool) -> str:
-        def predicate(e: parse_format_string.Element) -> bool:
-            return e.required or set(placeholders).issuperset(e.placeholders)
+        available = set(placeholders)
+        elements = [e for e in self._elements if e.required or available.issuperset(e.placeholders)]
+        if not positional:
+            return "".join([e.part for e in elements])
+
+        used = self._extract_placeholders(elements)
+        if len(set(used)) == len(used):
+            return "".join([e.positional_part for e in elements])
 
-        return "".join(e.positional_part if positional else e.part for e in filter(predicate, self._elements))
+        # Anonymous fields would need one argument per occurrence. Number them instead.
+        return _number_fields("".join([e.part for e in elements]), used)
 
     def partial(self, defaults: Mapping[str, Any]) -> "Format":
         """Get a partially formatted :meth:`fstring`.
@@ -159,29 +184,31 @@ class Format:
             A partially formatted fstring.
         """
         new_fmt, _placeholders = parse_format_string.Element.parse_block(self._fmt, defaults=defaults)
-        return Format(new_fmt)
+        return _parse_cached(new_fmt)
 
     @staticmethod
     def parse(fmt: FormatType) -> "Format":
         """Parse a format.
 
+        Formats are immutable, so ``str`` input may return a previously parsed instance.
+
         Args:
             fmt: Input to parse.
 
         Returns:
             A ``Format`` instance.
         """
-        return fmt if isinstance(fmt, Format) else Format(fmt)
+        return fmt if isinstance(fmt, Format) else _parse_cached(fmt)
 
     @property
     def placeholders(self) -> PlaceholdersTuple:
         """All placeholders in the order in which they appear."""
-        return self._extract_placeholders(self._elements)
+        return self._placeholders
 
     @property
     def required_placeholders(self) -> PlaceholdersTuple:
         """All required placeholders in the order in which they appear."""
-        return self._extract_placeholders(filter(lambda e: e.required, self._elements))
+        return self._required_placeholders
 
     @property
     def optional_placeholders(self) -> PlaceholdersTuple:  # pragma: no cover
@@ -197,3 +224,25 @@ class Format:
 
     def __repr__(self) -> str:
         return f"{tname(self)}({self._fmt!r})"
+
+
+def _number_fields(fstring: str, placeholders: PlaceholdersTuple) -> str:
+    index = {placeholder: str(i) for i, placeholder in enumerate(dict.fromkeys(placeholders))}
+
+    parts = []
+    for literal_text, field_name, format_spec, conversion in _FORMATTER.parse(fstring):
+        parts.append(literal_text.replace("{", "{{").replace("}", "}}"))
+        if field_name is not None:
+            placeholder, dot, attribute = field_name.partition(".")
+            parts.extend(("{", index[placeholder], dot, attribute))
+            if conversion:
+                parts.append("!" + conversion)
+            if format_spec:
+                parts.append(":" + format_spec)
+            parts.append("}")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(fmt: str) -> Format:
+    return Format(fmt)
@@ -1,4 +1,6 @@
 from collections.abc import Sequence
+from itertools import starmap
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Generic
 
 from rics.misc import tname
@@ -30,6 +32,7 @@ class FormatApplier(Generic[NameType, SourceType, IdType]):
         self._translations = translations
         self._source = translations.source
         self._placeholder_names = translations.placeholders
+        self._placeholder_pos = {name: i for i, name in enumerate(self._placeholder_names)}
         self._n_ids = len(translations.records)
         self._transformer = transformer
 
@@ -56,15 +59,14 @@ class FormatApplier(Generic[NameType, SourceType, IdType]):
         """
         if placeholders is None:
             # Use as many placeholders as possible.
-            placeholders = tuple(filter(self._placeholder_names.__contains__, fmt.placeholders))
+            placeholders = tuple(filter(self._placeholder_pos.__contains__, fmt.placeholders))
 
         fstring = fmt.fstring(placeholders, positional=True)
-        real_translations = self._apply(fstring, placeholders)
+        # Repeated placeholders are numbered by fstring(), so each value is passed only once.
+        real_translations = self._apply(fstring, tuple(dict.fromkeys(placeholders)))
 
-        if default_fmt_placeholders is None:
-            default_fmt_placeholders = {}
-
-        partial = default_fmt.partial(default_fmt_placeholders)
+        # Without defaults, partial() would just parse the same format again.
+        partial = default_fmt.partial(default_fmt_placeholders) if default_fmt_placeholders else default_fmt
         try:
             default_fstring = partial.fstring(positional=True)
         except KeyError as e:
@@ -83,11 +85,19 @@ class FormatApplier(Generic[NameType, SourceType, IdType]):
         """
         return self._translations.to_dict()
 
-    def to_pandas(self) -> "pandas.DataFrame":
-        """Get the underlying data used for translations as a :class:`pandas.DataFrame`."""
+    def to_pandas(self, *, convert_dtypes: bool = True) -> "pandas.DataFrame":
+        """Get the underlying data used for translations as a :class:`pandas.DataFrame`.
+
+        Args:
+            convert_dtypes: If ``True``, call :meth:`pandas.DataFrame.convert_dtypes` on the frame before returning.
+
+        Returns:
+            A ``DataFrame`` with one column per placeholder.
+        """
         from pandas import DataFrame
 
-        return DataFrame(self.to_dict()).convert_dtypes()
+        df = DataFrame(self.to_dict())
+        return df.convert_dtypes() if convert_dtypes else df
 
     @property
     def records(self) -> Sequence[Sequence[Any]]:
@@ -107,12 +117,16 @@ class FormatApplier(Generic[NameType, SourceType, IdType]):
             A dict ``{idx: translated_id}``.
         """
         id_pos, records = self._translations.id_pos, self._translations.records
+        ids = map(itemgetter(id_pos), records)
 
         if self._placeholder_names == placeholders:
-            return {record[id_pos]: fstring.format(*record) for record in records}
+            # Let C-level iterators unpack records; no per-record lookups of the format method.
+            return dict(zip(ids, starmap(fstring.format, records)))
         else:
-            pos = tuple(map(self._placeholder_names.index, placeholders))
-            return {record[id_pos]: fstring.format(*(record[i] for i in pos)) for record in records}
+            # Gather one column per placeholder, then let zip() build the argument tuples.
+            columns = [list(map(itemgetter(self._placeholder_pos[name]), records)) for name in placeholders]
+            args = zip(*columns) if columns else (() for _ in records)
+            return dict(zip(ids, starmap(fstring.format, args)))
 
     @property
     def source(self) -> SourceType:
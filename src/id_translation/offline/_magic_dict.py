@@ -1,5 +1,8 @@
 import logging
-from collections.abc import Iterator, MutableMapping
+import re
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, MutableMapping, ValuesView
+from itertools import islice
+from string import Formatter
 from typing import Any
 from uuid import UUID
 
@@ -11,6 +14,9 @@ from ..types import IdType
 from ._format import Format
 from .types import TranslatedIds
 
+_MAX_REPR_ITEMS = 25
+"""Maximum number of translations shown by ``MagicDict.__repr__``."""
+
 
 class MagicDict(MutableMapping[IdType, str]):
     """Dictionary type for translated IDs.
@@ -104,8 +110,10 @@ class MagicDict(MutableMapping[IdType, str]):
         self._real: TranslatedIds[IdType] = real_translations
         self._default = self._verify_default_value(default_value)
         self._cast_key = enable_uuid_heuristics
+        self._cast_hits: dict[Any, IdType] = {}  # Real keys found by casting, e.g. str -> UUID.
 
         self._try_add_missing_key = None
+        self._failed_keys: set[IdType] = set()  # Keys that try_add_missing_key did not add.
         if transformer is not None:
             transformer.update_translations(real_translations)
             self._try_add_missing_key = transformer.try_add_missing_key
@@ -117,6 +125,21 @@ class MagicDict(MutableMapping[IdType, str]):
         """
         return self[__key]
 
+    def translate_many(self, keys: Iterable[IdType]) -> list[str]:
+        """Translate many keys at once.
+
+        Equivalent to ``[magic[key] for key in keys]``, but faster since keys in the :attr:`real` translations are
+        looked up directly.
+
+        Args:
+            keys: Keys to translate.
+
+        Returns:
+            A list of translations, in the same order as the `keys`.
+        """
+        real = self._real
+        return [real[key] if key in real else self[key] for key in keys]
+
     @property
     def real(self) -> dict[IdType, str]:
         """Returns the backing dict."""
@@ -134,8 +157,20 @@ class MagicDict(MutableMapping[IdType, str]):
         if key in self._real:
             return self._real[key]
 
-        key = self._on_read(key)
-        return self._real[key] if key in self._real else self.default_value.format(key)
+        if key in self._cast_hits:
+            real_key = self._cast_hits[key]
+            if real_key in self._real:
+                return self._real[real_key]
+
+        if self._cast_key or self._try_add_missing_key is not None:
+            real_key = self._on_read(key)
+            if real_key in self._real:
+                if real_key is not key and isinstance(key, str):
+                    self._cast_hits[key] = real_key
+                return self._real[real_key]
+            key = real_key
+
+        return self._default.format(key)
 
     def __contains__(self, key: Any) -> bool:
         """Always returns ``True``."""
@@ -143,7 +178,7 @@ class MagicDict(MutableMapping[IdType, str]):
 
     def _on_read(self, key: IdType) -> IdType:
         key = self._try_stringify(key)
-        if self._try_add_missing_key and key not in self._real:
+        if self._try_add_missing_key and key not in self._real and key not in self._failed_keys:
             try:
                 self._try_add_missing_key(key, translations=self)
             except TransformerStop as e:
@@ -151,6 +186,8 @@ class MagicDict(MutableMapping[IdType, str]):
                     call = f"{tname(self._try_add_missing_key, prefix_classname=True)}({key!r}, translations=self)"
                     self.LOGGER.debug(f"try_add_missing_key: {call} raised {e!r}. Dropping this callback function.")
                 self._try_add_missing_key = None
+            if key not in self._real:
+                self._failed_keys.add(key)
         return key
 
     def __setitem__(self, key: IdType, value: str) -> None:
@@ -163,41 +200,78 @@ class MagicDict(MutableMapping[IdType, str]):
 
     def _on_write(self, key: IdType) -> IdType:
         key = self._try_stringify(key)
+        self._failed_keys.clear()  # New translations may allow try_add_missing_key to succeed.
         return key
 
     def __len__(self) -> int:
         return len(self._real)
 
+    def keys(self) -> KeysView[IdType]:
+        """Return a view of the :attr:`real` keys."""
+        return self._real.keys()
+
+    def values(self) -> ValuesView[str]:
+        """Return a view of the :attr:`real` values."""
+        return self._real.values()
+
+    def items(self) -> ItemsView[IdType, str]:
+        """Return a view of the :attr:`real` items."""
+        return self._real.items()
+
     def __iter__(self) -> Iterator[IdType]:
         return iter(self._real)
 
     def __repr__(self) -> str:
-        return repr(self._real)
+        n_more = len(self._real) - _MAX_REPR_ITEMS
+        if n_more <= 0:
+            return repr(self._real)
+
+        items = ", ".join(f"{key!r}: {value!r}" for key, value in islice(self._real.items(), _MAX_REPR_ITEMS))
+        return f"{{{items}, ...}} (+{n_more} IDs)"
 
     @classmethod
     def _verify_default_value(cls, default_value: str) -> str:
-        for sample in "id", 0, UUID(int=0):
-            try:
-                default_value.format(sample)
-                return default_value  # Formatting OK
-            except KeyError as e:  # noqa: PERF203
-                raise ValueError(f"Bad {default_value=}") from e
-            except Exception:  # noqa: S110
-                pass  # Attribute error, value error, etc. Happens naturally when the sample type is wrong.
+        try:
+            roots = [_FIELD_ROOT.match(field)[0] for field in _iter_fields(default_value)]  # type: ignore[index]
+        except ValueError as e:
+            raise ValueError(f"Bad {default_value=}") from e
+
+        n_automatic = roots.count("")
+        if n_automatic > 1 or (n_automatic and "0" in roots) or not set(roots).issubset(("", "0")):
+            raise ValueError(f"Bad {default_value=}; expected at most one positional placeholder.")
 
         return default_value
 
 
+_FORMATTER = Formatter()
+_FIELD_ROOT = re.compile(r"[^.\[]*")
+
+
+def _iter_fields(fmt: str) -> Iterator[str]:
+    for _, field, spec, _ in _FORMATTER.parse(fmt):
+        if field is not None:
+            yield field
+            if spec:
+                yield from _iter_fields(spec)
+
+
 def _try_stringify_many(real_translations: TranslatedIds[IdType]) -> tuple[TranslatedIds[IdType], bool]:
-    original_ids = list(real_translations)
-    if len(original_ids) == 0:
+    if len(real_translations) == 0:
         return real_translations, True
 
-    new_keys = _uuid_utils.try_cast_many(original_ids)
-    if not isinstance(new_keys[0], UUID):
+    first = next(iter(real_translations))
+    if isinstance(first, UUID):
+        return real_translations, True  # Keys are already UUIDs; nothing to convert.
+    if not isinstance(_uuid_utils.try_cast_one(first), UUID):
         return real_translations, False  # Keys are not UUID-like.
 
-    uuid_translations = {uuid: real_translations[idx] for uuid, idx in zip(new_keys, original_ids)}
+    try:
+        uuid_translations: TranslatedIds[Any] = dict(
+            zip(map(UUID, real_translations), real_translations.values())  # type: ignore[arg-type]
+        )
+    except (ValueError, AttributeError, TypeError):
+        return real_translations, False  # Some keys are not UUID-like.
+
     if len(real_translations) != len(uuid_translations):
         raise TypeError("Duplicate UUIDs found. Verify translation sources or set enable_uuid_heuristics=False.")
 
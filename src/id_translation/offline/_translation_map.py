@@ -70,13 +70,19 @@ class TranslationMap(
         """
         return {applier.source: applier.to_dict() for applier in self._format_appliers.values()}
 
-    def to_pandas(self) -> dict[SourceType, "pandas.DataFrame"]:
+    def to_pandas(self, *, convert_dtypes: bool = True) -> dict[SourceType, "pandas.DataFrame"]:
         """Get the underlying data used for translations as :class:`pandas.DataFrame`.
 
+        Args:
+            convert_dtypes: If ``True``, call :meth:`pandas.DataFrame.convert_dtypes` on each frame before returning.
+
         Returns:
             A dict ``{source: DataFrame}``.
         """
-        return {applier.source: applier.to_pandas() for applier in self._format_appliers.values()}
+        return {
+            applier.source: applier.to_pandas(convert_dtypes=convert_dtypes)
+            for applier in self._format_appliers.values()
+        }
 
     def to_translations(self, fmt: FormatType = None) -> dict[SourceType, MagicDict[IdType]]:
         """Create translations for all sources.
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 import pytest
@@ -40,6 +41,36 @@ def test_like_database_table(value, expected_match):
     assert new_value == new_candidates[expected_pos]
 
 
+def test_like_database_table_cache(monkeypatch):
+    monkeypatch.setattr(hf, "_NOUN_TRANSFORMER_CACHE", {})
+    hf._normalize_noun_cached.cache_clear()
+
+    assert hf.like_database_table("city_id", ["cities"], None) == ("city", ["city"])
+    assert hf.like_database_table("city_id", ["cities"], None) == ("city", ["city"])
+    assert hf._normalize_noun_cached.cache_info().hits == 2
+
+    call_count = 0
+
+    def p2s(s):
+        nonlocal call_count
+        call_count += 1
+        return s
+
+    hf.like_database_table("city_id", ["cities"], None, plural_to_singular=p2s)
+    hf.like_database_table("city_id", ["cities"], None, plural_to_singular=p2s)
+    assert call_count == 4
+    assert hf._normalize_noun_cached.cache_info().hits == 2
+
+
+def test_like_database_table_interned():
+    value, candidates = hf.like_database_table("City_ID", ["Cities"], None)
+    assert value is sys.intern("city")
+    assert candidates[0] is sys.intern("city")
+
+    value, _ = hf.like_database_table("City_ID", ["Cities"], None, plural_to_singular=lambda s: (s,))
+    assert value == ("city",)
+
+
 @pytest.mark.parametrize(
     "value, candidates, expect_match",
     [
@@ -113,6 +144,26 @@ def test_candidate_fstring_alias(fstring, expected_candidates):
     assert list(actual_candidates) == expected_candidates
 
 
+@pytest.mark.parametrize("key", ["value", "candidate", "context"])
+def test_candidate_fstring_alias_reserved_kwarg(key):
+    with pytest.raises(TypeError, match=f"multiple values for argument '{key}'"):
+        hf.candidate_fstring_alias("VALUE", ["CAND0"], None, fstring="{candidate}", **{key: "KWARG"})
+
+
+@pytest.mark.parametrize(
+    "placeholder, columns, expected",
+    [
+        ("name", ["city_name", "City"], {"city"}),
+        ("name", ["City", "city_name"], {"city"}),
+        ("name", ["CITY_NAME", "city_id"], {"city_name"}),
+        ("id", ["city", "City_Id"], {"city_id"}),
+        ("id", ["city", "city_name"], set()),
+    ],
+)
+def test_smurf_columns(placeholder, columns, expected):
+    assert hf.smurf_columns(placeholder, columns, "City") == expected
+
+
 class TestNounTransformer:
     @pytest.mark.parametrize("singular, plural", SINGULAR_TO_PLURAL)
     def test_word_list(self, singular, plural):
@@ -120,6 +171,21 @@ class TestNounTransformer:
         actual = transformer(plural)
         assert actual == singular, f"{plural=}"
 
+    def test_subclass_suffixes(self):
+        class OxenTransformer(hf.NounTransformer):
+            PLURAL_TO_SINGULAR_SUFFIXES = (("en", ""),)
+
+        transformer = OxenTransformer()
+        assert transformer("oxen") == "ox"
+        assert transformer("cats") == "cats"
+
+    def test_call_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(hf.NounTransformer, "_MAX_CACHE_SIZE", 2)
+        transformer = hf.NounTransformer()
+
+        assert [transformer(noun) for noun in ("cats", "dogs", "cities", "cities")] == ["cat", "dog", "city", "city"]
+        assert transformer._cache == {"cats": "cat", "dogs": "dog"}
+
     def test_cached(self, monkeypatch):
         monkeypatch.setattr(hf, "_NOUN_TRANSFORMER_CACHE", {})
 
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from collections.abc import Iterable
 
 import pytest
@@ -175,7 +177,23 @@ def test_disabled():
     with pytest.raises(ScoringDisabledError) as e:
         mapper.compute_scores("ab", {1})
     assert e.value.value == "b"
+    assert "strict override-only mode" in str(e.value)
+    assert str(e.value).endswith("mapping-primer.html#override-only-mapping page.")
 
     mapper = Mapper("disabled", overrides={"a": 1}, score_function_kwargs=dict(strict=False))
     assert mapper.apply("ab", {1}).flatten() == {"a": 1}
     assert mapper.apply("b", {1}).flatten() == {}
+
+
+@pytest.mark.parametrize("ref", ["", "override-only-mapping"])
+@pytest.mark.parametrize("cls", [MappingError, exceptions.UnmappedValuesError, exceptions.CardinalityError])
+def test_pickle_mapping_error(cls, ref):
+    error = cls("message", ref)
+    assert error.args == (("message", ref) if ref else ("message",))
+    assert str(error).startswith("message\n")
+    assert str(error).endswith(f"mapping-primer.html{'#' + ref if ref else ''} page.")
+
+    for copied in pickle.loads(pickle.dumps(error)), copy.copy(error), type(error)(*error.args):  # noqa: S301
+        assert type(copied) is cls
+        assert copied.args == error.args
+        assert str(copied) == str(error)
@@ -32,6 +32,31 @@ def test_stable(func, dtype):
             assert scores[i] == actual_scores[i]
 
 
+@pytest.mark.parametrize("add_length_ratio_term", [True, False])
+def test_modified_hamming_vectorized(monkeypatch, add_length_ratio_term):
+    candidates = [*make(sf._VECTORIZE_MIN_CANDIDATES, str), "e", "été", "id", "_id"]
+    values = [*make(6, str), "id", "été"]
+    kwargs = {"add_length_ratio_term": add_length_ratio_term}
+
+    vectorized = [list(sf.modified_hamming(v, candidates, None, **kwargs)) for v in values]
+    monkeypatch.setattr(sf, "_VECTORIZE_MIN_CANDIDATES", len(candidates) + 1)
+    expected = [list(sf.modified_hamming(v, candidates, None, **kwargs)) for v in values]
+
+    assert vectorized == expected
+
+
+@pytest.mark.parametrize("vectorize", [True, False])
+def test_modified_hamming_min_score(monkeypatch, vectorize):
+    if not vectorize:
+        monkeypatch.setattr(sf, "_VECTORIZE_MIN_CANDIDATES", 10_000)
+
+    candidates = [*make(sf._VECTORIZE_MIN_CANDIDATES, str), "id", "_id", "identifier"]
+    for value in [*make(6, str), "id", "iid"]:
+        scores = list(sf.modified_hamming(value, candidates, None))
+        actual = list(sf.modified_hamming(value, candidates, None, min_score=0.3))
+        assert actual == [s if s >= 0.3 else -float("inf") for s in scores]
+
+
 def make(count, dtype):
     if dtype is int:
         return make_int(count)
@@ -1,3 +1,4 @@
+import logging
 import warnings
 
 import numpy as np
@@ -7,6 +8,7 @@ import pytest
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=UserWarning)
     from id_translation.mapping import Cardinality, DirectionalMapping, support
+    from id_translation.mapping.exceptions import AmbiguousScoreError
 
 
 def test_enable_verbose_debug_messages():
@@ -21,6 +23,21 @@ def test_enable_verbose_debug_messages():
     assert before == (filter_functions.VERBOSE, heuristic_functions.VERBOSE, score_functions.VERBOSE)
 
 
+def test_enable_verbose_debug_messages_nested():
+    from id_translation.mapping import _mapper, score_functions
+
+    score_functions.VERBOSE = False
+
+    with support.enable_verbose_debug_messages():
+        with support.enable_verbose_debug_messages():
+            assert score_functions.VERBOSE
+        assert score_functions.VERBOSE
+        assert _mapper.FORCE_VERBOSE
+
+    assert not score_functions.VERBOSE
+    assert not _mapper.FORCE_VERBOSE
+
+
 @pytest.mark.parametrize(
     "cardinality, min_score, expected",
     [
@@ -45,9 +62,104 @@ def test_enable_verbose_debug_messages():
 )
 def test_natural_number_mapping(cardinality, min_score, expected):
     score = pd.DataFrame(np.arange(0, 20).reshape((4, -1)))
-    score.columns = list(map("c{}".format, score))
-    score.columns.name = "candidates"  # type: ignore[attr-defined]
+    score.columns = pd.Index(list(map("c{}".format, score)), name="candidates")
     score.index.name = "values"
     dm: DirectionalMapping[int, str] = support.MatchScores(score, min_score).to_directional_mapping(cardinality)
     actual = dm.left_to_right
     assert actual == expected
+
+
+def test_get_above_and_below():
+    score = pd.DataFrame(
+        [[0.5, np.nan, 1.0], [1.0, -np.inf, 0.5]],
+        index=["v0", "v1"],
+        columns=["c0", "c1", "c2"],
+    )
+    match_scores = support.MatchScores(score, 0.75)
+
+    records: list[support.MatchScores.Record[str, str]] = match_scores.get_above()
+    above = [(r.value, r.candidate, r.score) for r in records]
+    assert above == [("v0", "c2", 1.0), ("v1", "c0", 1.0)]
+
+    records = match_scores.get_below()
+    below = [(r.value, r.candidate, r.score) for r in records]
+    assert below == [("v0", "c0", 0.5), ("v1", "c2", 0.5), ("v1", "c1", -np.inf)]
+
+
+def test_sort_once(monkeypatch):
+    score = pd.DataFrame([[0.5, 1.0], [1.0, 0.25]], index=["v0", "v1"], columns=["c0", "c1"])
+    logger = logging.getLogger(__name__).getChild("test_sort_once")
+    logger.setLevel(logging.INFO)
+    match_scores = support.MatchScores(score, 0.75, logger)
+
+    calls = 0
+    argsort = np.argsort
+
+    def counting_argsort(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return argsort(*args, **kwargs)
+
+    monkeypatch.setattr(np, "argsort", counting_argsort)
+
+    assert len(match_scores.get_above()) == 2
+    assert len(match_scores.get_below()) == 2
+    assert match_scores.to_directional_mapping().left_to_right == match_scores.to_directional_mapping().left_to_right
+    assert calls == 2  # All cells for get_above/get_below, then only those above the threshold for mapping.
+
+
+@pytest.mark.parametrize("cardinality", [None, *Cardinality])
+def test_with_and_without_rejections(cardinality):
+    rng = np.random.default_rng(2024)
+
+    for _ in range(25):
+        score = pd.DataFrame(rng.choice([0.1, 0.5, 0.9, 1.0, np.inf, -np.inf, np.nan], size=(4, 5)))
+        expected = run_match_scores(score, cardinality, level=logging.DEBUG)
+        assert run_match_scores(score, cardinality, level=logging.INFO) == expected
+
+
+@pytest.mark.parametrize("cardinality", [None, *Cardinality])
+def test_with_and_without_rejections_duplicate_labels(cardinality):
+    rng = np.random.default_rng(2024)
+
+    for _ in range(25):
+        score = pd.DataFrame(
+            rng.choice([0.1, 0.5, 0.9, 1.0, np.inf, -np.inf, np.nan], size=(4, 5)),
+            index=["v0", "v1", "v0", "v2"],
+            columns=["c0", "c1", "c1", "c2", "c0"],
+        )
+        expected = run_match_scores(score, cardinality, level=logging.DEBUG)
+        assert run_match_scores(score, cardinality, level=logging.INFO) == expected
+
+
+def run_match_scores(score, cardinality, *, level):
+    logger = logging.getLogger(__name__).getChild("run_match_scores")
+    logger.setLevel(level)
+    try:
+        return support.MatchScores(score, 0.5, logger).to_directional_mapping(cardinality).left_to_right
+    except AmbiguousScoreError as e:
+        return str(e)
+
+
+@pytest.mark.parametrize(
+    "cardinality, expected",
+    [
+        (Cardinality.OneToOne, {"v0": ("c0",), "v1": ("c1",)}),
+        (Cardinality.OneToMany, {"v0": ("c0",), "v1": ("c1",)}),
+        (Cardinality.ManyToOne, {"v0": ("c0",), "v1": ("c1",)}),
+        (Cardinality.ManyToMany, {"v0": ("c0", "c0", "c1"), "v1": ("c1",)}),
+    ],
+)
+@pytest.mark.parametrize("level", [logging.DEBUG, logging.INFO])
+def test_duplicate_values(cardinality, expected, level):
+    score = pd.DataFrame([[1.0, 0.0], [0.0, 0.9], [0.8, 0.7]], index=["v0", "v1", "v0"], columns=["c0", "c1"])
+    assert run_match_scores(score, cardinality, level=level) == expected
+
+
+@pytest.mark.parametrize("cardinality", [None, *Cardinality])
+def test_duplicate_labels(cardinality):
+    score = pd.DataFrame([[0.9, 0.1], [0.2, 0.8]], index=["a", "a"], columns=["x", "y"])
+    expected = run_match_scores(score, cardinality, level=logging.DEBUG)
+    assert run_match_scores(score, cardinality, level=logging.INFO) == expected
+    if cardinality in (Cardinality.OneToOne, Cardinality.ManyToOne):
+        assert expected == {"a": ("x",)}
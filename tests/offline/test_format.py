@@ -83,6 +83,20 @@ def test_formatting(fmt, expected):
     assert positional_false == expected
 
 
+@pytest.mark.parametrize(
+    "fmt, expected",
+    [
+        ("{id} ({id})", "{0} ({0})"),
+        ("{id!r:>6}:{name}:{id.imag}", "{0!r:>6}:{1}:{0.imag}"),
+        ("{{{id}}}[, {name}={id}]", "{{{0}}}, {1}={0}"),
+    ],
+)
+def test_repeated_placeholders(fmt, expected):
+    fstring = Format(fmt).fstring(["id", "name"], positional=True)
+    assert fstring == expected
+    assert fstring.format(1999, "Sofia") == Format(fmt).format(id=1999, name="Sofia")
+
+
 class TestPartial:
     @pytest.mark.parametrize("id_part", ["{id}", "{id!r}", "{id!s:8.2}", "{id!r:^12}"])
     def test_string(self, id_part):
@@ -140,3 +154,20 @@ class TestPartial:
         ).partial({"optional_provided": "<Provided optional>"})
 
         assert actual.fstring(kwargs).format(**kwargs) == expected.fstring(kwargs).format(**kwargs)
+
+
+def test_parse_cached():
+    assert Format.parse("{id}:{name}") is Format.parse("{id}:{name}")
+    assert Format("{id}:{name}").partial({"name": "x"}) is Format("{id}:{name}").partial({"name": "x"})
+
+    fmt = Format("{id}:{name}")
+    assert Format.parse(fmt) is fmt
+
+
+def test_fstring_cached(fmt):
+    assert fmt.fstring(("id", "name"), positional=True) is fmt.fstring(("id", "name"), positional=True)
+    assert fmt.fstring(("id", "name")) == "{id}:{name}"
+    assert fmt.fstring(iter(("id", "code", "name"))) == "{id}:{code}:{name}"
+
+    with pytest.raises(KeyError):
+        fmt.fstring(("name",))
@@ -28,3 +28,20 @@ def test_explicit_placeholders(fmt):
         default_fmt_placeholders={"baz": "default-baz", "foo": "default-baz"},
     )
     assert ans == {1: "3 1", 2: "4 2"}
+
+
+def test_no_placeholders():
+    translations = PlaceholderTranslations("source", ("id", "name"), [(1, "a"), (2, "b")], 0)
+    applier = FormatApplier[str, str, int](translations)
+
+    ans = applier(Format("{{constant}}"), default_fmt=Format(""))
+    assert ans == {1: "{constant}", 2: "{constant}"}
+
+
+@pytest.mark.parametrize("convert_dtypes", [True, False])
+def test_to_pandas(convert_dtypes):
+    translations = PlaceholderTranslations("source", ("id", "name"), [(1, "a"), (2, "b")], 0)
+    df = FormatApplier[str, str, int](translations).to_pandas(convert_dtypes=convert_dtypes)
+
+    assert df.to_dict(orient="list") == {"id": [1, 2], "name": ["a", "b"]}
+    assert str(df["name"].dtype) == ("string" if convert_dtypes else "object")
@@ -1,3 +1,4 @@
+from typing import Any
 from uuid import UUID
 
 import pytest
@@ -56,6 +57,11 @@ def test_bad_uuids():
         )
 
 
+def test_mixed_keys():
+    real = {"aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee": "uuid", "not-a-uuid": "str"}
+    assert MagicDict(real, enable_uuid_heuristics=True).real is real
+
+
 @pytest.mark.parametrize("kind", [str.upper, str.lower, UUID])
 def test_uuid_contains_and_delete(kind):
     uuid = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
@@ -110,3 +116,92 @@ class DummyTransformer(Transformer[int]):
 
         if (value := {2: "TWO", 3: "THREE"}.get(key)) is not None:
             translations[key] = value
+
+
+@pytest.mark.parametrize(
+    "key", [1, "short", "{aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee}", "aaaaaaaabbbbccccddddeeeeeeeeeeee"]
+)
+def test_uuid_heuristics_key_types(key):
+    uuid = UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
+    md = MagicDict({uuid: "found"}, enable_uuid_heuristics=True)
+    expected = "found" if isinstance(key, str) and len(key) >= 32 else f"<Failed: id={key!r}>"
+    assert md[key] == expected
+
+
+def test_uuid_keys_not_copied():
+    real = {UUID(int=i): str(i) for i in range(3)}
+    assert MagicDict(real, enable_uuid_heuristics=True).real is real
+
+
+def test_views():
+    real = {1991: "1991:Richard", 1999: "1999:Sofia"}
+    subject = MagicDict(real)
+
+    assert list(subject.keys()) == list(real)
+    assert list(subject.values()) == list(real.values())
+    assert list(subject.items()) == list(real.items())
+    assert -1 in subject
+    assert -1 not in subject.keys()  # noqa: SIM118
+    assert (-1, subject[-1]) not in subject.items()
+    assert subject[-1] not in subject.values()
+    assert 1991 in subject.keys()  # noqa: SIM118
+    assert (1991, "1991:Richard") in subject.items()
+    assert subject == real
+
+
+def test_uuid_string_hits_cached():
+    string_uuid = "550e8400-e29b-41d4-a716-446655440000"
+    subject = MagicDict({string_uuid: "Found!"})
+
+    for _ in range(2):
+        assert subject[string_uuid] == "Found!"
+        assert subject[string_uuid.upper()] == "Found!"
+    assert subject._cast_hits == {string_uuid: UUID(string_uuid), string_uuid.upper(): UUID(string_uuid)}
+
+    del subject[string_uuid]
+    assert subject[string_uuid] == f"<Failed: id={UUID(string_uuid)!r}>"
+
+
+@pytest.mark.parametrize("default_value", ["{}", "{!r:>10}", "{0.hex}", "{0}/{0[0]}", "no placeholders"])
+def test_default_value(default_value):
+    assert MagicDict({}, default_value).default_value == default_value
+
+
+@pytest.mark.parametrize("default_value", ["{x}", "{}{}", "{}{0}", "{1}", "{:{width}}", "{"])
+def test_bad_default_value(default_value):
+    with pytest.raises(ValueError, match="Bad default_value"):
+        MagicDict({}, default_value)
+
+
+def test_translate_many():
+    string_uuid = "550e8400-e29b-41d4-a716-446655440000"
+    real: dict[Any, str] = {string_uuid: "Found!"}
+    subject = MagicDict(real, transformer=DummyTransformer())
+
+    keys = [UUID(string_uuid), string_uuid.upper(), 2, 2, 5]
+    expected = ["Found!", "Found!", "TWO", "TWO", "<Failed: id=5>"]
+    assert subject.translate_many(keys) == expected
+    assert subject.translate_many(keys) == [subject[key] for key in keys]
+
+
+def test_transformer_failed_keys():
+    transformer = DummyTransformer()
+    transformer.max_try = 100
+    subject = MagicDict({0: "ZERO"}, transformer=transformer)
+
+    assert subject.translate_many([7, 7, 7]) == ["<Failed: id=7>"] * 3
+    assert transformer.call_counts["try_add_missing_key"] == 1
+
+    subject[1] = "ONE"  # May allow the transformer to succeed.
+    assert subject[7] == "<Failed: id=7>"
+    assert transformer.call_counts["try_add_missing_key"] == 2
+
+
+def test_repr():
+    subject = MagicDict({i: str(i) for i in range(100)})
+    assert repr(subject).startswith("{0: '0', 1: '1', ")
+    assert repr(subject).endswith(", 24: '24', ...} (+75 IDs)")
+
+    for i in range(25, 100):
+        del subject[i]
+    assert repr(subject) == repr(subject.real)
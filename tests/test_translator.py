@@ -273,6 +273,15 @@ def test_id_only_default(hex_fetcher):
     }
 
 
+def test_repeated_placeholder_default():
+    t = UnitTestTranslator(
+        {"people": {"id": [1999], "name": ["Sofia"]}},
+        fmt="{id}:{id}:{name}",
+        default_fmt="{id} ({id!r:>6})",
+    )
+    assert t.translate([1999, 2000], names="people") == ["1999:1999:Sofia", "2000 (  2000)"]
+
+
 def test_extra_placeholder():
     t = UnitTestTranslator(
         {"people": {"id": [1999], "name": ["Sofia"]}},